@@ -23,27 +23,48 @@ Usage:
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
+import re
+import select
+import shutil
 import signal
+import socket
 import subprocess
 import sys
 import time
-from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration
 # ─────────────────────────────────────────────────────────────────────────────
 
 CONFIG_FILE = Path.home() / ".config" / "settings-hub" / "wallpaper.json"
+RUNTIME_DIR = Path(f"/run/user/{os.getuid()}")
+STATE_FILE = RUNTIME_DIR / "wallpaper.state"
+
+# How long a recorded wallpaper counts as just applied for --once
+STATE_FRESH_SECONDS = 10.0
 
 log = logging.getLogger("wallpaper-service")
 
+# Signals the daemon handles; blocked and dequeued synchronously by the main loop
+_DAEMON_SIGNALS = {signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD}
+
+# Last parsed config, keyed by the (st_mtime_ns, st_size) it was read at
+_config_cache: Optional[tuple[tuple[int, int], WallpaperConfig]] = None
+
 
 class WallpaperType(Enum):
     VIDEO = "video"
@@ -64,6 +85,41 @@ class WallpaperConfig:
     @classmethod
     def load(cls) -> WallpaperConfig:
         """Load configuration from disk."""
+        return cls.load_with_key()[1]
+
+    @classmethod
+    def load_with_key(cls) -> tuple[Optional[tuple[int, int]], WallpaperConfig]:
+        """Load configuration from disk, along with the file key it was read at.
+
+        The key is the config file's (st_mtime_ns, st_size), or None if it
+        could not be read. The parsed config is cached against it, so
+        repeated reloads of an unchanged file cost a single stat().
+        """
+        global _config_cache
+
+        try:
+            st = CONFIG_FILE.stat()
+        except OSError:
+            _config_cache = None
+            return None, cls._parse(None)
+
+        key = (st.st_mtime_ns, st.st_size)
+        if _config_cache is not None and _config_cache[0] == key:
+            return _config_cache
+
+        try:
+            data = _json_loads(CONFIG_FILE.read_bytes())
+        except Exception as e:
+            log.warning(f"Failed to load config: {e}")
+            _config_cache = None
+            return None, cls._parse(None)
+
+        _config_cache = (key, cls._parse(data))
+        return _config_cache
+
+    @classmethod
+    def _parse(cls, data: Optional[dict]) -> WallpaperConfig:
+        """Build a config from parsed JSON, falling back to defaults."""
         # Defaults
         active_type = WallpaperType.VIDEO
         video_path = None
@@ -72,11 +128,8 @@ class WallpaperConfig:
         video_loop = True
         image_fit = "fill"
 
-        if CONFIG_FILE.exists():
+        if data is not None:
             try:
-                with open(CONFIG_FILE) as f:
-                    data = json.load(f)
-
                 if "active_type" in data:
                     try:
                         active_type = WallpaperType(data["active_type"])
@@ -116,7 +169,7 @@ class WallpaperConfig:
                         image_path = legacy_path
 
             except Exception as e:
-                log.warning(f"Failed to load config: {e}")
+                log.warning(f"Failed to parse config: {e}")
 
         if image_fit == "cover":
             image_fit = "fill"
@@ -134,53 +187,212 @@ class WallpaperConfig:
             image_fit=image_fit,
         )
 
-    @property
-    def identity(self) -> str:
-        """Unique identifier for change detection."""
+    def __post_init__(self):
+        # Frozen, so the identity can be computed once up front
         if self.active_type == WallpaperType.VIDEO:
-            return f"video:{self.video_path}:loop={self.video_loop}"
+            identity = f"video:{self.video_path}:loop={self.video_loop}"
         elif self.active_type == WallpaperType.IMAGE:
-            return f"image:{self.image_path}:fit={self.image_fit}"
+            identity = f"image:{self.image_path}:fit={self.image_fit}"
         else:
-            return f"solid:{self.solid_color}"
+            identity = f"solid:{self.solid_color}"
+        object.__setattr__(self, "_identity", identity)
+
+    @property
+    def identity(self) -> str:
+        """Unique identifier for change detection."""
+        return self._identity
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Wallpaper Process Abstractions
 # ─────────────────────────────────────────────────────────────────────────────
 
-class WallpaperProcess(ABC):
-    """Base class for wallpaper rendering processes."""
+class _LazyJoin:
+    """Defers ' '.join() of a command until a log record is actually emitted."""
 
-    def __init__(self, output: str):
-        self.output = output
-        self.process: Optional[subprocess.Popen] = None
+    def __init__(self, cmd: tuple[str, ...]):
+        self.cmd = cmd
+
+    def __str__(self) -> str:
+        return " ".join(self.cmd)
+
+
+# Environment snapshots taken once at startup; the daemon never changes its
+# environment. Shared without copying, so callers must not mutate them
+# (posix_spawn only reads the mapping).
+_FROZEN_ENV: dict[str, str] = dict(os.environ)
+_FROZEN_ENV_NO_LDLP = {k: v for k, v in _FROZEN_ENV.items() if k != "LD_LIBRARY_PATH"}
 
-    @abstractmethod
-    def _build_command(self) -> list[str]:
-        """Build the command to execute."""
-        pass
 
-    def _get_env(self) -> dict:
-        """Get environment for subprocess. Override if needed."""
-        return os.environ.copy()
+# Resolved executable paths, so PATH is only searched once per program
+_executables: dict[str, str] = {}
+
+
+def _resolve_executable(name: str) -> Optional[str]:
+    """Resolve a program name against PATH, caching successful lookups."""
+    path = _executables.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _executables[name] = path
+    return path
+
+
+class _SpawnedProcess:
+    """Minimal Popen-like handle for a child started with os.posix_spawn()."""
+
+    def __init__(self, args: tuple[str, ...], pid: int, stderr, *, leftover: Optional[Path] = None):
+        self.args = args
+        self.pid = pid
+        self.stderr = stderr
+        self.leftover = leftover  # file the child may leave behind, removed once reaped
+        self.returncode: Optional[int] = None
+
+    def _reap(self, options: int) -> Optional[int]:
+        if self.returncode is not None:
+            return self.returncode
+        try:
+            pid, status = os.waitpid(self.pid, options)
+        except ChildProcessError:
+            # Reaped elsewhere; exit status is unknown (Popen reports 0 too)
+            pid, status = self.pid, 0
+        if pid == self.pid:
+            self.returncode = os.waitstatus_to_exitcode(status)
+            self.stderr.close()
+            if self.leftover is not None:
+                self.leftover.unlink(missing_ok=True)
+        return self.returncode
+
+    def poll(self) -> Optional[int]:
+        return self._reap(os.WNOHANG)
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if timeout is None:
+            return self._reap(0)
+
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.05)
+        return self.returncode
+
+    def send_signal(self, sig: int) -> None:
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+
+@dataclass(eq=False)
+class WallpaperProcess:
+    """A wallpaper renderer: a fixed command line and its running child, if any."""
+    argv: tuple[str, ...]
+    env: Mapping[str, str] = field(repr=False)  # shared snapshot, must not be mutated
+    ipc_socket: Optional[Path] = None  # mpv IPC socket used to detect readiness
+    process: Optional[_SpawnedProcess] = field(default=None, init=False, repr=False)
 
     def start(self) -> bool:
         """Start the wallpaper process. Returns True if started successfully."""
-        cmd = self._build_command()
-        log.info(f"Starting: {' '.join(cmd)}")
+        log.info("Starting: %s", _LazyJoin(self.argv))
 
+        executable = _resolve_executable(self.argv[0])
+        if executable is None:
+            log.error(f"Failed to start process: {self.argv[0]} not found")
+            return False
+
+        # posix_spawn avoids fork's page-table copy. The empty sigmask
+        # unblocks the daemon's signals in the child, and SIGPIPE/SIGXFSZ
+        # go back to their defaults (Python ignores them), as Popen does.
+        stderr_r, stderr_w = os.pipe()
         try:
-            self.process = subprocess.Popen(
-                cmd,
-                env=self._get_env(),
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
+            pid = os.posix_spawn(
+                executable,
+                self.argv,
+                self.env,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, stderr_w, 2),
+                ],
+                setsigmask=(),
+                setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
             )
-            return True
         except Exception as e:
+            os.close(stderr_r)
             log.error(f"Failed to start process: {e}")
             return False
+        finally:
+            os.close(stderr_w)
+
+        self.process = _SpawnedProcess(
+            self.argv,
+            pid,
+            os.fdopen(stderr_r, "rb", buffering=0),
+            # mpv leaves its IPC socket behind if killed or crashed
+            leftover=self.ipc_socket,
+        )
+        return True
+
+    def wait_until_ready(self, timeout: float = 2.0) -> bool:
+        """Wait for the new wallpaper to render. Returns True once it has.
+
+        mpvpaper is asked over its IPC socket. swaybg draws almost
+        immediately, so it gets a brief settle period, cut short if the
+        process writes to stderr (usually a startup error).
+        """
+        if self.process is None:
+            return False
+        if self.ipc_socket is not None:
+            return self._wait_for_mpv(timeout)
+        select.select([self.process.stderr], [], [], min(timeout, 0.05))
+        return True
+
+    def _wait_for_mpv(self, timeout: float) -> bool:
+        """Wait until mpv reports playback over its IPC socket."""
+        deadline = time.monotonic() + timeout
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # mpv creates the socket shortly after startup
+            while True:
+                try:
+                    sock.connect(str(self.ipc_socket))
+                    break
+                except (FileNotFoundError, ConnectionRefusedError):
+                    if time.monotonic() >= deadline or not self.is_alive():
+                        return False
+                    time.sleep(0.01)
+
+            # Observing replies with the current value straight away, so a
+            # file that finished loading before we connected is not missed.
+            try:
+                sock.sendall(b'{"command": ["observe_property", 1, "playback-time"]}\n')
+            except OSError:
+                return False
+
+            buf = b""
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                sock.settimeout(remaining)
+                try:
+                    chunk = sock.recv(4096)
+                except OSError:
+                    return False
+                if not chunk:
+                    return False
+                *lines, buf = (buf + chunk).split(b"\n")
+                if any(_mpv_event_ready(line) for line in lines):
+                    return True
+        finally:
+            sock.close()
 
     def is_alive(self) -> bool:
         """Check if process is still running."""
@@ -196,7 +408,7 @@ class WallpaperProcess(ABC):
 
         try:
             self.process.wait(timeout=timeout)
-            log.debug(f"Process {pid} terminated gracefully")
+            log.debug("Process %d terminated gracefully", pid)
         except subprocess.TimeoutExpired:
             log.warning(f"Process {pid} didn't terminate, killing...")
             self.process.kill()
@@ -207,103 +419,122 @@ class WallpaperProcess(ABC):
         return self.process.pid if self.process else None
 
 
-class MpvPaperProcess(WallpaperProcess):
+# Old and new mpvpaper overlap during a swap, so each gets its own IPC socket
+_mpv_ipc_ids = itertools.count()
+
+
+def _mpv_event_ready(line: bytes) -> bool:
+    """Return True if an mpv IPC message shows playback has started."""
+    try:
+        msg = json.loads(line)
+    except ValueError:
+        return False
+    if msg.get("event") == "playback-restart":
+        return True
+    return msg.get("event") == "property-change" and msg.get("data") is not None
+
+
+def _mpvpaper_process(output: str, video_path: Path, loop: bool) -> WallpaperProcess:
     """Video wallpaper using mpvpaper."""
+    ipc_socket = RUNTIME_DIR / f"mpvpaper-{os.getpid()}-{next(_mpv_ipc_ids)}.sock"
+    options = "no-audio --really-quiet"
+    if loop:
+        options = "no-audio loop --really-quiet"
+    argv = (
+        "mpvpaper",
+        "-o", f"{options} --input-ipc-server={ipc_socket}",
+        output,
+        str(video_path),
+    )
+    # Clear LD_LIBRARY_PATH to avoid Wayfire's custom pixman
+    return WallpaperProcess(argv, _FROZEN_ENV_NO_LDLP, ipc_socket=ipc_socket)
+
 
-    def __init__(self, output: str, video_path: Path, *, loop: bool = True):
-        super().__init__(output)
-        self.video_path = video_path
-        self.loop = loop
-
-    def _build_command(self) -> list[str]:
-        options = "no-audio --really-quiet"
-        if self.loop:
-            options = "no-audio loop --really-quiet"
-        return [
-            "mpvpaper",
-            "-o", options,
-            self.output,
-            str(self.video_path),
-        ]
-
-    def _get_env(self) -> dict:
-        # Clear LD_LIBRARY_PATH to avoid Wayfire's custom pixman
-        env = super()._get_env()
-        env.pop("LD_LIBRARY_PATH", None)
-        return env
-
-
-class SwaybgImageProcess(WallpaperProcess):
-    """Static image wallpaper using swaybg."""
-
-    def __init__(self, output: str, image_path: Path, *, mode: str = "fill"):
-        super().__init__(output)
-        self.image_path = image_path
-        self.mode = mode
-
-    def _build_command(self) -> list[str]:
-        return [
-            "swaybg",
-            "-o", self.output,
-            "-i", str(self.image_path),
-            "-m", self.mode,
-        ]
-
-
-class SwaybgColorProcess(WallpaperProcess):
-    """Solid color wallpaper using swaybg."""
-
-    def __init__(self, output: str, color: str):
-        super().__init__(output)
-        self.color = color
-
-    def _build_command(self) -> list[str]:
-        return [
-            "swaybg",
-            "-o", self.output,
-            "-c", self.color,
-        ]
+def _swaybg_process(output: str, *args: str) -> WallpaperProcess:
+    """Static image or solid color wallpaper using swaybg."""
+    return WallpaperProcess(("swaybg", "-o", output, *args), _FROZEN_ENV)
+
+
+# Fallback chain: each type falls through to the ones after it
+_TYPE_ORDER = (WallpaperType.VIDEO, WallpaperType.IMAGE, WallpaperType.SOLID)
+_START_IDX = {wp_type: i for i, wp_type in enumerate(_TYPE_ORDER)}
+
+
+def build_process(config: WallpaperConfig, output: str) -> Optional[WallpaperProcess]:
+    """Create appropriate wallpaper process based on config with fallback chain."""
+    # Try from configured type, falling through on failure
+    for wp_type in _TYPE_ORDER[_START_IDX[config.active_type]:]:
+        if wp_type is WallpaperType.SOLID:
+            return _swaybg_process(output, "-c", config.solid_color)
+
+        path = config.video_path if wp_type is WallpaperType.VIDEO else config.image_path
+        if not path:
+            continue
+
+        try:
+            os.stat(path)
+        except (OSError, ValueError):  # ValueError: embedded NUL, as Path.exists()
+            log.warning(f"{wp_type.value} file not found: {path}")
+            continue
+
+        if wp_type is WallpaperType.VIDEO:
+            return _mpvpaper_process(output, path, config.video_loop)
+        return _swaybg_process(output, "-i", str(path), "-m", config.image_fit)
+
+    return None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Monitor Detection
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Output names are the unindented header lines of wlr-randr's output
+_WLR_HEADER_RE = re.compile(rb"^(\S+)", re.M)
+
+# Monitor found by the wlr-randr fallback, reused for the life of the process
+_primary_monitor_cache: Optional[str] = None
+
+
 def get_primary_monitor() -> str:
     """Get the primary monitor from monitor-detect service.
 
     Reads from /run/user/<uid>/primary-monitor which is created by
-    monitor-detect.service.
+    monitor-detect.service. The unit is ordered after that service, so the
+    file is read once rather than waited for.
     """
-    runtime_file = Path(f"/run/user/{os.getuid()}/primary-monitor")
-
-    # Wait up to 5 seconds for monitor-detect to create the file
-    for attempt in range(10):
-        if runtime_file.exists():
-            try:
-                monitor = runtime_file.read_text().strip()
-                if monitor:
-                    return monitor
-            except Exception as e:
-                log.warning(f"Failed to read {runtime_file}: {e}")
+    runtime_file = RUNTIME_DIR / "primary-monitor"
 
-        if attempt < 9:
-            time.sleep(0.5)
+    def _wlr_fallback() -> Optional[str]:
+        global _primary_monitor_cache
+        if _primary_monitor_cache is not None:
+            return _primary_monitor_cache
 
-    # Emergency fallback
-    log.error(f"{runtime_file} not found - monitor-detect.service may have failed")
-    log.info("Attempting fallback to wlr-randr...")
+        log.info("Attempting fallback to wlr-randr...")
+        try:
+            result = subprocess.run(["wlr-randr"], capture_output=True, timeout=5)
+            if result.returncode == 0:
+                m = _WLR_HEADER_RE.search(result.stdout)
+                if m:
+                    _primary_monitor_cache = m.group(1).decode()
+                    return _primary_monitor_cache
+        except Exception:
+            pass
+        return None
 
     try:
-        result = subprocess.run(
-            ["wlr-randr"], capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            for line in result.stdout.strip().split('\n'):
-                if line and not line.startswith(' '):
-                    return line.split()[0]
-    except Exception:
+        monitor = runtime_file.read_text().strip()
+        if monitor:
+            return monitor
+    except FileNotFoundError:
         pass
+    except Exception as e:
+        log.warning(f"Failed to read {runtime_file}: {e}")
+
+    # Emergency fallback (e.g. --once run outside systemd)
+    log.error(f"{runtime_file} not found - monitor-detect.service may have failed")
+    monitor = _wlr_fallback()
+    if monitor:
+        return monitor
 
     log.error("Could not determine primary monitor!")
     return "DP-1"  # Last resort
@@ -313,6 +544,35 @@ def get_primary_monitor() -> str:
 # Wallpaper Daemon
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _write_state(config: WallpaperConfig, output: str, pid: int) -> None:
+    """Record the applied wallpaper so a following --once run can skip it."""
+    try:
+        STATE_FILE.write_text(f"{config.identity}\n{output}\n{pid}\n")
+    except OSError as e:
+        log.debug("Failed to write %s: %s", STATE_FILE, e)
+
+
+def _state_is_current(config: WallpaperConfig, output: str) -> bool:
+    """True if `config` was applied to `output` within STATE_FRESH_SECONDS and is still running."""
+    try:
+        mtime = STATE_FILE.stat().st_mtime
+        identity, state_output, pid, _ = STATE_FILE.read_text().split("\n", 3)
+        if (
+            identity != config.identity
+            or state_output != output
+            or time.time() - mtime > STATE_FRESH_SECONDS
+        ):
+            return False
+        os.kill(int(pid), 0)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+# si_code values for a SIGCHLD caused by the child exiting (not stopping)
+_CHILD_EXIT_CODES = {os.CLD_EXITED, os.CLD_KILLED, os.CLD_DUMPED}
+
+
 @dataclass
 class CrashTracker:
     """Tracks crash frequency for rate limiting restarts."""
@@ -333,7 +593,12 @@ class CrashTracker:
         self.last_time = now
 
         if self.count > self.max_before_backoff:
-            return min(30.0, self.count * 2.0)
+            # Exponential in the crashes past the threshold: 2, 4, 8, 16, 30s
+            backoff = min(30.0, float(1 << min(self.count - self.max_before_backoff, 5)))
+            # Measure the window from the restart, not the crash, or every
+            # backoff would outlast the window and reset the count.
+            self.last_time = now + backoff
+            return backoff
         return 0.0
 
     def reset_if_stable(self) -> None:
@@ -350,58 +615,36 @@ class WallpaperDaemon:
         self.current_config: Optional[WallpaperConfig] = None
         self.output: Optional[str] = None
         self.crash_tracker = CrashTracker()
-
-        # Signal flags (written by signal handlers, read by main loop)
-        self._reload_requested = False
-        self._shutdown_requested = False
-        self._child_exited = False
-
-    def _create_process(self, config: WallpaperConfig, output: str) -> Optional[WallpaperProcess]:
-        """Create appropriate wallpaper process based on config with fallback chain."""
-        attempts = [
-            (WallpaperType.VIDEO, config.video_path, lambda p: MpvPaperProcess(output, p, loop=config.video_loop)),
-            (WallpaperType.IMAGE, config.image_path, lambda p: SwaybgImageProcess(output, p, mode=config.image_fit)),
-            (WallpaperType.SOLID, None, lambda _: SwaybgColorProcess(output, config.solid_color)),
-        ]
-
-        # Find starting point in fallback chain
-        start_idx = next(
-            (i for i, (t, _, _) in enumerate(attempts) if t == config.active_type),
-            0
-        )
-
-        # Try from configured type, falling through on failure
-        for wp_type, path, factory in attempts[start_idx:]:
-            if wp_type == WallpaperType.SOLID:
-                return factory(None)
-
-            if path and path.exists():
-                return factory(path)
-            elif path:
-                log.warning(f"{wp_type.value} file not found: {path}")
-
-        return None
-
-    def hot_swap(self, force: bool = False) -> bool:
+        # Config file (mtime_ns, size) the current wallpaper was started from
+        self._config_key: Optional[tuple[int, int]] = None
+
+    def hot_swap(
+        self,
+        force: bool = False,
+        loaded: Optional[tuple[Optional[tuple[int, int]], WallpaperConfig]] = None,
+    ) -> bool:
         """
         Hot-swap to new wallpaper configuration.
 
         Strategy: Start new wallpaper FIRST, then kill old one.
         This ensures seamless transition with no visible gap.
 
+        `loaded` is a (key, config) pair from WallpaperConfig.load_with_key(),
+        if the caller already has one.
+
         Returns True if swap succeeded.
         """
-        config = WallpaperConfig.load()
+        config_key, config = loaded or WallpaperConfig.load_with_key()
 
         # Skip if nothing changed (unless forced)
         if not force and self.current_config and config.identity == self.current_config.identity:
-            log.debug(f"Config unchanged ({config.identity}), skipping swap")
+            log.debug("Config unchanged (%s), skipping swap", config.identity)
             return True
 
         log.info(f"Hot-swapping: {self.current_config.identity if self.current_config else 'none'} -> {config.identity}")
 
         # Create and start new process
-        new_process = self._create_process(config, self.output)
+        new_process = build_process(config, self.output)
         if new_process is None:
             log.error("Failed to create wallpaper process")
             return False
@@ -409,13 +652,15 @@ class WallpaperDaemon:
         if not new_process.start():
             return False
 
-        # Brief delay for new wallpaper to initialize and render
-        time.sleep(0.3)
+        # Wait for new wallpaper to initialize and render
+        ready = new_process.wait_until_ready(timeout=2.0)
 
         # Verify new process is still running
         if not new_process.is_alive():
             log.error("New wallpaper process died immediately")
             return False
+        if not ready:
+            log.warning("New wallpaper did not report ready in time, swapping anyway")
 
         # NOW kill the old wallpaper (new one is already visible)
         if self.current_process:
@@ -425,92 +670,131 @@ class WallpaperDaemon:
         # Update state
         self.current_process = new_process
         self.current_config = config
+        self._config_key = config_key
+        _write_state(config, self.output, new_process.pid)
         log.info(f"Wallpaper switched successfully (pid={new_process.pid})")
         return True
 
-    def _setup_signals(self) -> None:
-        """Install signal handlers."""
-
-        def on_sighup(signum, frame):
-            self._reload_requested = True
+    def _current_process_exited(self, info: signal.struct_siginfo) -> bool:
+        """Return True if the SIGCHLD described by `info` means the wallpaper process exited."""
+        proc = self.current_process
+        if proc is None:
+            return False
 
-        def on_sigterm(signum, frame):
-            self._shutdown_requested = True
+        if info.si_pid == proc.pid and info.si_code in _CHILD_EXIT_CODES:
+            proc.process.wait()  # reap and record returncode
+            return True
 
-        def on_sigchld(signum, frame):
-            self._child_exited = True
+        log.debug("SIGCHLD for pid %d (wallpaper pid=%s)", info.si_pid, proc.pid)
+        # SIGCHLD doesn't queue: if our child's exit coalesced with another
+        # child's, si_pid names the other one, so check ours without blocking.
+        return not proc.is_alive()
 
-        signal.signal(signal.SIGHUP, on_sighup)
-        signal.signal(signal.SIGTERM, on_sigterm)
-        signal.signal(signal.SIGINT, on_sigterm)
-        signal.signal(signal.SIGCHLD, on_sigchld)
+    def _setup_signals(self) -> None:
+        """Block daemon signals so the main loop can dequeue them with sigwaitinfo()."""
+        signal.pthread_sigmask(signal.SIG_BLOCK, _DAEMON_SIGNALS)
 
     def run(self, once: bool = False) -> int:
         """Main entry point. Returns exit code."""
+        self._config_key, config = WallpaperConfig.load_with_key()
         self.output = get_primary_monitor()
 
-        config = WallpaperConfig.load()
+        if once and _state_is_current(config, self.output):
+            log.info(f"Wallpaper already applied ({config.identity} on {self.output}), nothing to do")
+            return 0
+
         log.info(f"Starting: type={config.active_type.value}, output={self.output}")
 
+        # Block signals before the first child exists so its SIGCHLD can't be lost
+        if not once:
+            self._setup_signals()
+
         # Start initial wallpaper
-        self.current_process = self._create_process(config, self.output)
+        self.current_process = build_process(config, self.output)
         if self.current_process is None or not self.current_process.start():
             log.error("Failed to start initial wallpaper")
             return 1
 
         self.current_config = config
+        _write_state(config, self.output, self.current_process.pid)
 
         if once:
             log.info("Running in --once mode, exiting")
             return 0
 
-        self._setup_signals()
         log.info(f"Daemon running (pid={self.current_process.pid})")
         log.info(f"Send SIGHUP to reload: kill -HUP {os.getpid()}")
 
         # ─── Event-driven main loop ───────────────────────────────────────
-        # Uses signal.pause() to sleep until a signal arrives.
-        # This is far more efficient than polling with timeouts.
+        # Daemon signals are blocked and dequeued one at a time with
+        # sigwaitinfo(), so none can be missed or arrive mid-swap.
         # ──────────────────────────────────────────────────────────────────
 
-        while not self._shutdown_requested:
-            # Sleep until ANY signal arrives (SIGHUP, SIGCHLD, SIGTERM, etc.)
-            signal.pause()
+        while True:
+            # Sleep until ANY daemon signal is pending (SIGHUP, SIGCHLD, SIGTERM, etc.)
+            info = signal.sigwaitinfo(_DAEMON_SIGNALS)
+
+            if info.si_signo in (signal.SIGTERM, signal.SIGINT):
+                break
 
             # Handle reload request (SIGHUP)
-            if self._reload_requested:
-                self._reload_requested = False
+            if info.si_signo == signal.SIGHUP:
+                # Fast path: SIGHUP sent to the daemon only (the wallpaper
+                # survived) and the config file is untouched. This races with
+                # `systemctl kill -s HUP`, which signals us before the child:
+                # the child may still look alive here and die just after. Its
+                # SIGCHLD is then recognised as a reload below, not a crash.
+                loaded = WallpaperConfig.load_with_key()
+                if (
+                    self._config_key is not None
+                    and loaded[0] == self._config_key
+                    and self.current_process
+                    and self.current_process.is_alive()
+                ):
+                    log.info("Reload no-op: config unchanged and wallpaper running")
+                    continue
+
                 log.info("Processing reload request...")
                 # Force=True because systemd sends SIGHUP to entire cgroup,
                 # which kills swaybg/mpvpaper. We must restart even if
-                # config is unchanged.
-                self.hot_swap(force=True)
-                # Clear child_exited - the SIGCHLD from the killed process
-                # arrives during hot_swap and should be ignored.
-                self._child_exited = False
+                # config is unchanged. The SIGCHLD from the killed process
+                # stays queued and is ignored below once the new one runs.
+                self.hot_swap(force=True, loaded=loaded)
                 continue
 
             # Handle child process exit (SIGCHLD)
-            if self._child_exited:
-                self._child_exited = False
-
-                # Check if it was our wallpaper process
-                if self.current_process and not self.current_process.is_alive():
-                    returncode = self.current_process.process.returncode
-                    log.warning(f"Wallpaper process exited with code {returncode}")
-
-                    # Rate-limited restart
-                    backoff = self.crash_tracker.record_crash()
-                    if backoff > 0:
-                        log.warning(f"Too many crashes (attempt {self.crash_tracker.count}), waiting {backoff:.0f}s...")
-                        time.sleep(backoff)
-                    else:
-                        time.sleep(1)
-
+            # Check if it was our wallpaper process
+            if self._current_process_exited(info):
+                # Killed by the same cgroup-wide SIGHUP we took the fast path
+                # for: restart right away without counting it as a crash.
+                if (
+                    info.si_pid == self.current_process.pid
+                    and info.si_code == os.CLD_KILLED
+                    and info.si_status == signal.SIGHUP
+                ):
+                    log.info("Wallpaper process killed by SIGHUP, reloading...")
                     self.hot_swap(force=True)
+                    continue
+
+                returncode = self.current_process.process.returncode
+                log.warning(f"Wallpaper process exited with code {returncode}")
+
+                # Rate-limited restart
+                backoff = self.crash_tracker.record_crash()
+                if backoff > 0:
+                    log.warning(f"Too many crashes (attempt {self.crash_tracker.count}), waiting {backoff:.0f}s...")
                 else:
-                    # SIGCHLD for some other child process, ignore
-                    self.crash_tracker.reset_if_stable()
+                    backoff = 1.0
+
+                # Interruptible wait: SIGHUP restarts now, SIGTERM/SIGINT shut down
+                info = signal.sigtimedwait(_DAEMON_SIGNALS - {signal.SIGCHLD}, backoff)
+                if info is not None and info.si_signo != signal.SIGHUP:
+                    break
+
+                self.hot_swap(force=True)
+            else:
+                # SIGCHLD for some other child process, ignore
+                self.crash_tracker.reset_if_stable()
 
         # Clean shutdown
         log.info("Shutting down...")